@@ -10,13 +10,97 @@ This is where the "en route" optimization happens:
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from .neural_message import NeuralMessage, FocusMode
 
+try:
+    import ahocorasick  # Optional: single-pass multi-keyword matching
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _keyword_automaton(keywords: Tuple[str, ...]):
+    """Build (and cache) an Aho-Corasick automaton for a keyword set."""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, (keyword, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _scan_keywords(
+    text: str,
+    keywords: Sequence[str]
+) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Find keywords in text (both already lowercased).
+    
+    Returns (first_positions, counts) for the keywords that occur, with
+    non-overlapping counts per keyword as str.count would give. Uses one
+    pass over the text when pyahocorasick is installed.
+    """
+    first_positions: Dict[str, int] = {}
+    counts: Dict[str, int] = {}
+    words = tuple(sorted({keyword for keyword in keywords if keyword}))
+    
+    if '' in keywords:
+        first_positions[''] = 0
+        counts[''] = len(text) + 1
+    
+    if ahocorasick is not None and words:
+        next_free: Dict[str, int] = {}
+        for end_idx, (keyword, keyword_len) in _keyword_automaton(words).iter(text):
+            start = end_idx - keyword_len + 1
+            if start < next_free.get(keyword, 0):
+                continue  # Overlaps the previous hit of the same keyword
+            next_free[keyword] = end_idx + 1
+            if keyword not in counts:
+                first_positions[keyword] = start
+                counts[keyword] = 1
+            else:
+                counts[keyword] += 1
+        return first_positions, counts
+    
+    for keyword in words:
+        position = text.find(keyword)
+        if position == -1:
+            continue
+        count = 1
+        next_pos = text.find(keyword, position + len(keyword))
+        while next_pos != -1:
+            count += 1
+            next_pos = text.find(keyword, next_pos + len(keyword))
+        first_positions[keyword] = position
+        counts[keyword] = count
+    return first_positions, counts
+
+
+def _payload_size(payload: Dict) -> int:
+    """Cheap payload size estimate: str/bytes lengths, a flat cost otherwise."""
+    return sum(
+        len(value) if isinstance(value, (str, bytes)) else 64
+        for value in payload.values()
+    )
+
+
+def _approx_size(obj: Any) -> int:
+    """Rough character count of a nested result without building its repr."""
+    if isinstance(obj, (str, bytes)):
+        return len(obj)
+    if isinstance(obj, dict):
+        return sum(_approx_size(key) + _approx_size(value) for key, value in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return sum(_approx_size(item) for item in obj)
+    return 32
+
+
 class RelevanceScorer:
     """
     Scores content relevance against keywords and focus mode.
@@ -32,17 +116,28 @@ class RelevanceScorer:
             FocusMode.SUMMARIZATION: {'keyword_match': 0.4, 'semantic': 0.6},
             FocusMode.NAVIGATION: {'keyword_match': 0.8, 'semantic': 0.2},
         }
+        # Flattened keyword_match weight per mode for the scoring hot path
+        self._keyword_weight = {
+            mode: weights['keyword_match'] for mode, weights in self.focus_weights.items()
+        }
+        # LRU of recent scores: once refined, content repeats on later hops
+        self._score_cache: OrderedDict = OrderedDict()
+        self._cache_max = 2048
     
-    async def score_relevance(
+    def score_relevance(
         self,
         content: str,
         keywords: List[str],
         focus_mode: FocusMode,
-        threshold: float = 0.7
+        threshold: float = 0.7,
+        keywords_lower: Optional[Sequence[str]] = None
     ) -> Dict:
         """
         Score content relevance.
         
+        keywords_lower may carry the keywords already lowercased (aligned with
+        keywords) so callers that hold them don't pay for it again.
+        
         Returns:
             {
                 'score': 0.0-1.0,
@@ -54,36 +149,57 @@ class RelevanceScorer:
         if not content or not keywords:
             return {'score': 0.5, 'relevant': True, 'matching_keywords': [], 'reasoning': 'no content'}
         
+        # Keyed on a content digest, not hash(), so different documents can't
+        # collide; keywords stay as given since results echo their order and case
+        digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        cache_key = (digest, tuple(keywords), focus_mode, threshold)
+        cached = self._score_cache.get(cache_key)
+        if cached is not None:
+            self._score_cache.move_to_end(cache_key)
+            return dict(cached, matching_keywords=list(cached['matching_keywords']))
+        
         content_lower = content.lower()
-        keyword_scores = []
+        if keywords_lower is None:
+            keywords_lower = [keyword.lower() for keyword in keywords]
         matched = []
+        position_total = 0
+        frequency_total = 0
         
-        for keyword in keywords:
-            if keyword.lower() in content_lower:
-                # Count occurrences
-                count = content_lower.count(keyword.lower())
-                matched.append(keyword)
-                # Score based on position and frequency
-                position = content_lower.find(keyword.lower())
-                position_score = 1.0 - (position / max(len(content), 1))
-                frequency_score = min(count / 5, 1.0)  # Cap at 5 mentions
-                keyword_scores.append((position_score + frequency_score) / 2)
-        
-        # Calculate final score
-        if keyword_scores:
-            avg_score = sum(keyword_scores) / len(keyword_scores)
+        first_positions, counts = _scan_keywords(content_lower, keywords_lower)
+        
+        for keyword, keyword_lower in zip(keywords, keywords_lower):
+            position = first_positions.get(keyword_lower)
+            if position is None:
+                continue
+            matched.append(keyword)
+            position_total += position
+            count = counts[keyword_lower]
+            frequency_total += count if count < 5 else 5  # Cap at 5 mentions
+        
+        # Score based on position and frequency; each keyword scores
+        # ((1 - pos/len) + count/5) / 2, so the mean folds into the totals
+        if matched:
+            n = len(matched)
+            position_mean = position_total / (max(len(content), 1) * n)
+            frequency_mean = frequency_total / (5 * n)
+            avg_score = (1.0 - position_mean + frequency_mean) / 2
         else:
             avg_score = 0.0
         
-        weights = self.focus_weights.get(focus_mode, {'keyword_match': 0.5, 'semantic': 0.5})
-        final_score = avg_score * weights['keyword_match']
+        final_score = avg_score * self._keyword_weight.get(focus_mode, 0.5)
         
-        return {
+        result = {
             'score': min(final_score, 1.0),
             'relevant': final_score >= threshold,
             'matching_keywords': matched,
             'reasoning': f"Matched {len(matched)}/{len(keywords)} keywords"
         }
+        
+        self._score_cache[cache_key] = dict(result, matching_keywords=list(matched))
+        if len(self._score_cache) > self._cache_max:
+            self._score_cache.popitem(last=False)
+        
+        return result
 
 
 class ContextRefiner:
@@ -122,10 +238,14 @@ class ContextRefiner:
         # Track the hop
         message.context.add_hop(processor_id)
         
+        # Lowercase the focus keywords once for every helper on this hop
+        keywords = message.focus.keywords if message.focus else None
+        keywords_lower = tuple(keyword.lower() for keyword in keywords) if keywords else ()
+        
         # Apply focus mode refinements
         if message.focus and message.focus.mode:
             if message.focus.mode == FocusMode.RELEVANCE:
-                await self._apply_relevance_filter(message)
+                await self._apply_relevance_filter(message, keywords_lower)
             elif message.focus.mode == FocusMode.EXTRACTION:
                 await self._apply_extraction_focus(message)
             elif message.focus.mode == FocusMode.SUMMARIZATION:
@@ -134,13 +254,17 @@ class ContextRefiner:
                 await self._apply_analysis_focus(message)
         
         # Apply general optimizations
-        await self._compress_payload(message)
-        await self._remove_duplicates(message)
-        await self._prune_metadata(message)
+        self._compress_payload(message)
+        self._remove_duplicates(message)
+        self._prune_metadata(message)
         
         return message
     
-    async def _apply_relevance_filter(self, message: NeuralMessage):
+    async def _apply_relevance_filter(
+        self,
+        message: NeuralMessage,
+        keywords_lower: Optional[Sequence[str]] = None
+    ):
         """Filter content based on relevance threshold."""
         payload = message.payload
         
@@ -149,11 +273,12 @@ class ContextRefiner:
             keywords = message.focus.keywords if message.focus else []
             threshold = message.focus.relevance_threshold if message.focus else 0.7
             
-            score_result = await self.relevance_scorer.score_relevance(
+            score_result = self.relevance_scorer.score_relevance(
                 content=payload['html'],
                 keywords=keywords,
                 focus_mode=message.focus.mode if message.focus else FocusMode.RELEVANCE,
-                threshold=threshold
+                threshold=threshold,
+                keywords_lower=keywords_lower
             )
             
             message.context.relevance_score = score_result['score']
@@ -170,9 +295,15 @@ class ContextRefiner:
                 self.refinement_stats['filtered_count'] += 1
             else:
                 # Extract only relevant sections
-                relevant_html = await self._extract_relevant_sections(
+                matching = score_result['matching_keywords']
+                matching_lower = None
+                if keywords_lower:
+                    lower_of = dict(zip(keywords, keywords_lower))
+                    matching_lower = [lower_of[keyword] for keyword in matching]
+                relevant_html = self._extract_relevant_sections(
                     payload['html'],
-                    score_result['matching_keywords']
+                    matching,
+                    matching_lower
                 )
                 message.context.record_refinement(
                     'relevance_filter',
@@ -201,7 +332,7 @@ class ContextRefiner:
             message.context.record_refinement(
                 'entity_extraction',
                 original_size,
-                len(str(extraction_result))
+                _approx_size(extraction_result)
             )
     
     async def _apply_summarization(self, message: NeuralMessage):
@@ -241,44 +372,50 @@ class ContextRefiner:
             message.context.record_refinement(
                 'analysis_focus',
                 len(payload.get('html', '')),
-                len(str(structure))
+                _approx_size(structure)
             )
     
-    async def _compress_payload(self, message: NeuralMessage):
+    def _compress_payload(self, message: NeuralMessage):
         """Apply compression to payload."""
+        payload = message.payload
+        if 'html' not in payload:
+            # Nothing compressible (e.g. html already dropped by a focus step)
+            message.context.compression_ratio = 0.0
+            return
+        
         # Track original size
-        original = len(str(message.payload))
+        original = _payload_size(payload)
         
-        # Remove unnecessary whitespace
-        if 'html' in message.payload:
-            message.payload['html'] = self._remove_whitespace(message.payload['html'])
+        # Remove unnecessary whitespace; only html changes, so the new size
+        # follows from its length delta
+        html = payload['html']
+        compressed = self._remove_whitespace(html)
+        payload['html'] = compressed
+        current = original - (len(html) - len(compressed))
         
         if original > 0:
-            current = len(str(message.payload))
             message.context.compression_ratio = 1.0 - (current / original)
     
-    async def _remove_duplicates(self, message: NeuralMessage):
+    def _remove_duplicates(self, message: NeuralMessage):
         """Remove duplicate content."""
         payload = message.payload
         
         # Simple deduplication for lists
         for key in ['links', 'emails', 'urls']:
-            if key in payload and isinstance(payload[key], list):
-                seen = set()
-                unique = []
-                for item in payload[key]:
-                    if item not in seen:
-                        seen.add(item)
-                        unique.append(item)
-                if len(unique) < len(payload[key]):
-                    message.context.record_refinement(
-                        'deduplication',
-                        len(payload[key]),
-                        len(unique)
-                    )
-                    payload[key] = unique
+            items = payload.get(key)
+            if not items or not isinstance(items, list):
+                continue
+            # Order-preserving dedup in C; nothing is replaced when unique
+            unique = list(dict.fromkeys(items))
+            if len(unique) < len(items):
+                message.context.record_refinement(
+                    'deduplication',
+                    len(items),
+                    len(unique)
+                )
+                payload[key] = unique
     
-    async def _prune_metadata(self, message: NeuralMessage):
+    def _prune_metadata(self, message: NeuralMessage):
         """Remove unnecessary metadata."""
         payload = message.payload
         
@@ -288,31 +425,47 @@ class ContextRefiner:
             if field in payload:
                 del payload[field]
     
-    async def _extract_relevant_sections(
+    def _extract_relevant_sections(
         self,
         html: str,
-        keywords: List[str]
+        keywords: List[str],
+        keywords_lower: Optional[Sequence[str]] = None
     ) -> str:
         """Extract HTML sections containing keywords."""
         if not keywords:
             return html[:10000]  # Truncate if no keywords
         
         # Simple extraction - find keyword occurrences
-        relevant_parts = []
         html_lower = html.lower()
+        if keywords_lower is None:
+            keywords_lower = [keyword.lower() for keyword in keywords]
+        first_positions, _ = _scan_keywords(html_lower, keywords_lower)
+        
+        html_len = len(html)
+        windows = []
+        for keyword, keyword_lower in zip(keywords, keywords_lower):
+            start = first_positions.get(keyword_lower)
+            if start is not None:
+                # Context around keyword (500 chars before, 500 after)
+                windows.append((max(0, start - 500), min(html_len, start + len(keyword) + 500)))
+        
+        if not windows:
+            return html[:10000]
+        
+        # Merge overlapping windows so nearby hits are copied only once
+        windows.sort()
+        relevant_parts = []
+        current_start, current_end = windows[0]
+        for context_start, context_end in windows[1:]:
+            if context_start <= current_end:
+                if context_end > current_end:
+                    current_end = context_end
+            else:
+                relevant_parts.append(html[current_start:current_end])
+                current_start, current_end = context_start, context_end
+        relevant_parts.append(html[current_start:current_end])
         
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            start = html_lower.find(keyword_lower)
-            if start != -1:
-                # Extract context around keyword (500 chars before, 500 after)
-                context_start = max(0, start - 500)
-                context_end = min(len(html), start + len(keyword) + 500)
-                relevant_parts.append(html[context_start:context_end])
-        
-        if relevant_parts:
-            return '\n---\n'.join(relevant_parts)
-        return html[:10000]
+        return '\n---\n'.join(relevant_parts)
     
     async def _llm_extract_entities(
         self,
@@ -348,11 +501,9 @@ class ContextRefiner:
     
     def _remove_whitespace(self, text: str) -> str:
         """Remove unnecessary whitespace."""
-        import re
-        # Remove extra whitespace but preserve structure
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        return text
+        # split() tokenizes on any whitespace run in C, which is the same
+        # collapse-and-strip the old \s+ substitution produced
+        return ' '.join(text.split())
     
     def get_refinement_stats(self) -> Dict:
         """Get refinement statistics."""
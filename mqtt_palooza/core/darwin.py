@@ -1,4 +1,4 @@
-were"""
+"""
 Darwin Evolution Engine
 The adaptive intelligence layer for Mqtt-Palooza.
 
@@ -14,13 +14,70 @@ import json
 import logging
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Tuple
 import os
 import random
 
+try:
+    import aiohttp  # Optional: non-blocking HTTP for Darwin-2 LLM calls
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson  # Optional: C JSON codec for solution hashing and LLM replies
+
+    def _dumps_sorted(obj: Any) -> bytes:
+        try:
+            out = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. ints beyond 64 bits, which json encodes fine
+            return json.dumps(obj, sort_keys=True).encode()
+        if b'null' in out:
+            # orjson writes NaN/Infinity as null; keep them distinct from None
+            return json.dumps(obj, sort_keys=True).encode()
+        return out
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_sorted(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True).encode()
+
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Shared decoder for pulling the first JSON object out of free-form LLM text
+_JSON_DECODER = json.JSONDecoder()
+
+# Per-component signing keys, read from the environment on first use
+_SECRET_CACHE: Dict[str, bytes] = {}
+
+
+def _secret_for(component: str) -> bytes:
+    """Return the blake2b key for DARWIN_SECRET_<COMPONENT>, caching the env lookup."""
+    name = component.upper()
+    secret = _SECRET_CACHE.get(name)
+    if secret is None:
+        secret = os.getenv(f"DARWIN_SECRET_{name}", "default").encode()
+        if len(secret) > hashlib.blake2b.MAX_KEY_SIZE:
+            # blake2b keys are capped at 64 bytes; condense longer secrets
+            secret = hashlib.blake2b(secret).digest()
+        _SECRET_CACHE[name] = secret
+    return secret
+
+
+def _lineage_proof(parent_mutations: List[str], timestamp: float, secret: bytes) -> str:
+    """Keyed blake2b over "parent|...|timestamp", streamed."""
+    proof = hashlib.blake2b(digest_size=16, key=secret)
+    if parent_mutations:
+        proof.update("|".join(map(str, parent_mutations)).encode())
+        proof.update(b"|")
+    proof.update(str(timestamp).encode())
+    return proof.hexdigest()
+
 # ============================================================================
 # CONSTITUTION INTEGRATION
 # ============================================================================
@@ -39,6 +96,24 @@ CONSTITUTION_CANNOT_HAVES = [
     'single_point_of_failure'
 ]
 
+# Set views of the rules for C-level membership checks against dict keys
+_MUST_SET = frozenset(CONSTITUTION_MUST_HAVES)
+_CANNOT_SET = frozenset(CONSTITUTION_CANNOT_HAVES)
+
+
+def _collect_keys(obj: Any) -> set:
+    """All dict keys in obj, including those nested in dict/list values."""
+    keys = set()
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            keys.update(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return keys
+
 
 class ConstitutionalReview:
     """Result of constitutional mutation review"""
@@ -101,14 +176,7 @@ class DarwinMutation:
     
     def create_signature(self, component: str) -> str:
         """Create Darwin signature for traceability"""
-        lineage = self.parent_mutations + [self.timestamp]
-        lineage_str = "|".join(str(x) for x in lineage)
-        secret = os.getenv(f"DARWIN_SECRET_{component.upper()}", "default")
-        
-        proof = hashlib.blake2b(
-            f"{lineage_str}{secret}".encode(),
-            digest_size=16
-        ).hexdigest()
+        proof = _lineage_proof(self.parent_mutations, self.timestamp, _secret_for(component))
         
         self.darwin_signature = f"DARWIN-{component.upper()}-{proof}"
         return self.darwin_signature
@@ -186,31 +254,38 @@ class Darwin1Algorithm:
         
         return score
     
+    def evaluate_batch(self, mutations: List[Dict]) -> List[float]:
+        """Score a whole population in one pass (same result as evaluate_mutation)."""
+        check = self._check_constitution
+        return [
+            (1.0 - m.get('latency_improvement', 0)) * 0.30
+            + m.get('relevance_improvement', 0) * 0.40
+            + m.get('efficiency_improvement', 0) * 0.20
+            + check(m) * 0.10
+            for m in mutations
+        ]
+    
     def _check_constitution(self, mutation: Dict) -> float:
         """Check constitutional compliance"""
-        score = 1.0
-        
-        for required in CONSTITUTION_MUST_HAVES:
-            if required not in mutation:
-                score -= 0.05
-        
-        for forbidden in CONSTITUTION_CANNOT_HAVES:
-            if forbidden in mutation:
-                score = 0.0
-                break
+        keys = mutation.keys()
+        if _CANNOT_SET & keys:
+            return 0.0
         
-        return max(0.0, score)
+        missing = _MUST_SET - keys
+        return max(0.0, 1.0 - 0.05 * len(missing))
     
     def create_mutation(self, parent: Dict) -> Dict:
         """Create a mutation from a parent solution"""
         mutation = parent.copy()
+        rand = random.random
+        mutation_rate = self.config.mutation_rate
         
-        for key in list(mutation.keys()):
-            if isinstance(mutation[key], (int, float)) and random.random() < self.config.mutation_rate:
-                if isinstance(mutation[key], int):
-                    mutation[key] += random.randint(-5, 5)
+        for key, value in parent.items():
+            if isinstance(value, (int, float)) and rand() < mutation_rate:
+                if isinstance(value, int):
+                    mutation[key] = value + random.randint(-5, 5)
                 else:
-                    mutation[key] *= random.uniform(0.8, 1.2)
+                    mutation[key] = value * random.uniform(0.8, 1.2)
         
         mutation['mutation_timestamp'] = time.time()
         mutation['parent_hash'] = self._hash_solution(parent)
@@ -219,36 +294,40 @@ class Darwin1Algorithm:
     
     def _hash_solution(self, solution: Dict) -> str:
         """Create hash of solution for tracking"""
-        serialized = json.dumps(solution, sort_keys=True)
-        return hashlib.blake2b(serialized.encode(), digest_size=8).hexdigest()
+        return hashlib.blake2b(_dumps_sorted(solution), digest_size=8).hexdigest()
     
     def evolve(self, population: List[Dict]) -> List[Dict]:
         """Run evolutionary algorithm on population."""
         if len(population) < 2:
             return population
         
-        evaluated = [(self.evaluate_mutation(s), s) for s in population]
-        evaluated.sort(key=lambda x: x[0], reverse=True)
+        # Rank indices by score (stable, C-level key) rather than sorting
+        # (score, solution) tuples through a lambda
+        scores = self.evaluate_batch(population)
+        ranked = sorted(range(len(population)), key=scores.__getitem__, reverse=True)
         
-        survivor_count = max(2, int(len(evaluated) * self.config.survival_threshold))
-        survivors = [s for _, s in evaluated[:survivor_count]]
-        elites = [s for _, s in evaluated[:self.config.elite_count]]
+        survivor_count = max(2, int(len(population) * self.config.survival_threshold))
+        survivors = [population[i] for i in ranked[:survivor_count]]
+        elites = [population[i] for i in ranked[:self.config.elite_count]]
         
         next_gen = elites.copy()
         
-        while len(next_gen) < self.config.population_size:
-            if random.random() < self.config.crossover_rate:
-                child = self._crossover(
-                    random.choice(survivors),
-                    random.choice(survivors)
-                )
-                next_gen.append(child)
+        # Hoist attribute lookups out of the breeding loop
+        rand = random.random
+        choice = random.choice
+        crossover = self._crossover
+        mutate = self.create_mutation
+        crossover_rate = self.config.crossover_rate
+        population_size = self.config.population_size
+        
+        while len(next_gen) < population_size:
+            if rand() < crossover_rate:
+                next_gen.append(crossover(choice(survivors), choice(survivors)))
             else:
-                child = self.create_mutation(random.choice(survivors))
-                next_gen.append(child)
+                next_gen.append(mutate(choice(survivors)))
         
         self.metrics.mutation_count += len(next_gen)
-        best_score = evaluated[0][0]
+        best_score = scores[ranked[0]]
         if best_score > 0.5:
             self.metrics.successful_mutations += 1
         
@@ -289,10 +368,11 @@ class Darwin1Algorithm:
         best_fitness = -float('inf')
         
         for gen in range(max_generations):
-            evaluated = [(objective_function(s), s) for s in population]
-            evaluated.sort(key=lambda x: x[0], reverse=True)
+            fitness = list(map(objective_function, population))
             
-            current_best_fitness, current_best = evaluated[0]
+            # Only the best and the mean are needed, so one pass beats a sort
+            best_idx = max(range(len(fitness)), key=fitness.__getitem__)
+            current_best_fitness, current_best = fitness[best_idx], population[best_idx]
             
             if current_best_fitness > best_fitness:
                 best_fitness = current_best_fitness
@@ -301,13 +381,14 @@ class Darwin1Algorithm:
             history.append({
                 'generation': gen,
                 'best_fitness': current_best_fitness,
-                'avg_fitness': sum(f for f, _ in evaluated) / len(evaluated),
+                'avg_fitness': sum(fitness) / len(fitness),
                 'best_solution_hash': self._hash_solution(current_best)[:8]
             })
             
             population = self.evolve(population)
             
-            logger.info(f"Generation {gen}: Best fitness = {current_best_fitness:.4f}")
+            # Lazy %-args: skip formatting entirely when INFO is disabled
+            logger.info("Generation %d: Best fitness = %.4f", gen, current_best_fitness)
         
         return {
             'best_solution': best_solution,
@@ -329,12 +410,26 @@ class DarwinLLMConfig:
         model: str = "llama3.1:8b",
         evolution_interval: int = 300,
         min_samples_for_evolution: int = 10,
-        confidence_threshold: float = 0.8
+        confidence_threshold: float = 0.8,
+        max_connections: int = 32,
+        keep_alive: Optional[str] = None,
+        history_cap: int = 1000,
+        history_spill_path: Optional[str] = None
     ):
         self.model = model
         self.evolution_interval = evolution_interval
         self.min_samples_for_evolution = min_samples_for_evolution
         self.confidence_threshold = confidence_threshold
+        # Pooled HTTP connections kept open to Ollama
+        self.max_connections = max_connections
+        # Ollama keep_alive (e.g. "30m") so the model stays loaded between calls
+        self.keep_alive = keep_alive
+        # Evolutions kept in memory; older ones are dropped, or appended as
+        # JSON lines to history_spill_path when it is set
+        if history_cap < 1:
+            raise ValueError(f"history_cap must be at least 1, got {history_cap!r}")
+        self.history_cap = history_cap
+        self.history_spill_path = history_spill_path
 
 
 class DarwinLLM:
@@ -342,38 +437,81 @@ class DarwinLLM:
     Darwin-2: LLM-based adaptive learning and strategy evolution.
     """
     
+    # Sent as Ollama's `system` field: identical on every call, so the
+    # server can reuse its cached prefix and only prefill the outcome block
+    _EVOLUTION_SYSTEM_PROMPT = """Analyze the task outcomes you are given and propose strategy evolution.
+
+CONSTITUTIONAL REQUIREMENTS:
+- Must use fastest protocol available
+- Must carry DNA with context
+- Must refine en route
+
+Return JSON evolution proposal:
+{
+    "changes_summary": "brief description",
+    "parameter_adjustments": {"param": new_value},
+    "prompt_modifications": "new prompt text or modifications",
+    "expected_improvement": 0.0-1.0,
+    "confidence": 0.0-1.0,
+    "reasoning": "explanation"
+}"""
+    
+    # System prompt for evolve_strategies: same rules, but one proposal per ITEM
+    _BATCH_EVOLUTION_SYSTEM_PROMPT = """Analyze each ITEM of task outcomes you are given and propose strategy evolution for it.
+
+CONSTITUTIONAL REQUIREMENTS:
+- Must use fastest protocol available
+- Must carry DNA with context
+- Must refine en route
+
+Return a JSON array with one evolution proposal per ITEM, in ITEM order:
+[
+    {
+        "changes_summary": "brief description",
+        "parameter_adjustments": {"param": new_value},
+        "prompt_modifications": "new prompt text or modifications",
+        "expected_improvement": 0.0-1.0,
+        "confidence": 0.0-1.0,
+        "reasoning": "explanation"
+    }
+]"""
+    
     def __init__(self, config: DarwinLLMConfig = None, ollama_url: str = "http://localhost:11434"):
         self.config = config or DarwinLLMConfig()
         self.ollama_url = ollama_url
-        self.evolution_history: List[Dict] = []
+        self.evolution_history: Deque[Dict] = deque(maxlen=self.config.history_cap)
+        self._spill_queue: Optional[asyncio.Queue] = None
+        self._spill_task: Optional[asyncio.Task] = None
+        self._latest_by_task: Dict[str, Dict] = {}  # task_type -> newest evolution
         self.strategy_performance: Dict[str, Dict] = {}
         self.prompt_templates: Dict[str, str] = {}
+        self._session = None  # aiohttp.ClientSession, created on first call
         self._load_default_templates()
     
     def _load_default_templates(self):
         """Load default prompt templates"""
+        # Static instructions and schema lead so the prompt prefix is shared
+        # across calls; per-call values and content come last
         self.prompt_templates = {
             'extraction': """You are an expert data extractor.
-Your task: Extract {target_entities} from the following content.
-
-Focus: {focus_mode}
-Relevance threshold: {relevance_threshold}
-
-Content:
-{content}
+Your task: Extract the target entities from the content below.
 
 Return ONLY the extracted entities in JSON format:
 {{
     "entities": {{entity_name: value}},
     "confidence_scores": {{entity_name: 0.0-1.0}},
     "context_snippets": {{entity_name: relevant_text}}
-}}""",
+}}
 
-            'relevance': """You are a relevance filter.
-Your task: Determine if content is relevant to: {keywords}
+Target entities: {target_entities}
+Focus: {focus_mode}
+Relevance threshold: {relevance_threshold}
 
 Content:
-{content}
+{content}""",
+
+            'relevance': """You are a relevance filter.
+Your task: Determine if the content below is relevant to the given keywords.
 
 Return JSON:
 {{
@@ -381,16 +519,15 @@ Return JSON:
     "relevance_score": 0.0-1.0,
     "matching_passages": ["relevant text"],
     "reasoning": "explanation"
-}}""",
-
-            'summarization': """You are a content summarizer.
-Your task: Summarize the following content.
+}}
 
-Focus areas: {keywords}
-Max tokens: {max_tokens}
+Keywords: {keywords}
 
 Content:
-{content}
+{content}""",
+
+            'summarization': """You are a content summarizer.
+Your task: Summarize the content below.
 
 Return JSON:
 {{
@@ -398,16 +535,16 @@ Return JSON:
     "key_points": ["point 1", "point 2"],
     "omitted_sections": ["what was removed"],
     "confidence": 0.0-1.0
-}}""",
+}}
 
-            'analysis': """You are a strategic analyst.
-Your task: Analyze this data extraction scenario.
+Focus areas: {keywords}
+Max tokens: {max_tokens}
 
-Scenario: {scenario}
-Historical success rate: {success_rate}
+Content:
+{content}""",
 
-Results to analyze:
-{results}
+            'analysis': """You are a strategic analyst.
+Your task: Analyze the data extraction scenario below.
 
 Provide analysis and recommendations:
 {{
@@ -416,7 +553,13 @@ Provide analysis and recommendations:
     "failure_factors": ["what doesn't work"],
     "recommendations": ["suggested improvements"],
     "confidence": 0.0-1.0
-}}"""
+}}
+
+Scenario: {scenario}
+Historical success rate: {success_rate}
+
+Results to analyze:
+{results}"""
         }
     
     async def evolve_strategy(
@@ -437,9 +580,75 @@ Provide analysis and recommendations:
             task_type, success_patterns, failure_patterns
         )
         
-        response = await self._call_llm(evolution_prompt)
-        evolved = self._parse_evolution(response)
+        response = await self._call_llm(evolution_prompt, system=self._EVOLUTION_SYSTEM_PROMPT)
+        return self._record_evolution(self._parse_evolution(response), task_type, total_samples)
+    
+    async def evolve_strategies(
+        self,
+        requests: List[Tuple[str, List[Dict], List[Dict]]]
+    ) -> List[Dict]:
+        """
+        Evolve several (task_type, successes, failures) strategies at once.
+        
+        Eligible requests share one LLM call that asks for a JSON array with
+        a proposal per item. If that call fails, every item records the same
+        empty proposal a failed evolve_strategy call would; if it answers but
+        can't be split back up, items fall back to evolve_strategy one at a
+        time so the caller's concurrency limit still holds.
+        """
+        results: List[Optional[Dict]] = [None] * len(requests)
+        pending = []
+        for index, (task_type, successes, failures) in enumerate(requests):
+            if len(successes) + len(failures) < self.config.min_samples_for_evolution:
+                results[index] = {'status': 'insufficient_data'}
+            else:
+                pending.append(index)
+        
+        if len(pending) == 1:
+            results[pending[0]] = await self.evolve_strategy(*requests[pending[0]])
+        elif pending:
+            blocks = []
+            for item, index in enumerate(pending):
+                task_type, successes, failures = requests[index]
+                blocks.append(f"<<<ITEM {item}>>>\n" + self._create_evolution_prompt(
+                    task_type,
+                    self._analyze_patterns(successes, is_success=True),
+                    self._analyze_patterns(failures, is_success=False)
+                ))
+            blocks.append(
+                f"Return a JSON array of exactly {len(pending)} evolution proposals, "
+                f"one per ITEM, in ITEM order."
+            )
+            try:
+                response = await self._request_llm(
+                    "\n\n".join(blocks), system=self._BATCH_EVOLUTION_SYSTEM_PROMPT
+                )
+            except Exception as e:
+                # Retrying item by item would only hammer a failing endpoint
+                logger.error(f"Batched LLM call failed: {e}")
+                proposals = [{} for _ in pending]
+            else:
+                if response.strip() in ('', '{}'):
+                    logger.error("Batched LLM call returned no proposals")
+                    proposals = [{} for _ in pending]
+                else:
+                    proposals = self._parse_evolution_batch(response, len(pending))
+            
+            if proposals is None:
+                logger.warning("Batched evolution reply unusable; evolving items one by one")
+                for index in pending:
+                    results[index] = await self.evolve_strategy(*requests[index])
+            else:
+                for index, proposal in zip(pending, proposals):
+                    task_type, successes, failures = requests[index]
+                    results[index] = self._record_evolution(
+                        proposal, task_type, len(successes) + len(failures)
+                    )
         
+        return results
+    
+    def _record_evolution(self, evolved: Dict, task_type: str, total_samples: int) -> Dict:
+        """Constitution-check a parsed proposal and add it to the history"""
         review = self._review_constitution(evolved)
         if not review.approved:
             evolved = self._patch_for_constitution(evolved, review)
@@ -447,7 +656,11 @@ Provide analysis and recommendations:
         evolved['timestamp'] = time.time()
         evolved['task_type'] = task_type
         evolved['sample_count'] = total_samples
-        self.evolution_history.append(evolved)
+        history = self.evolution_history
+        if self.config.history_spill_path and len(history) == history.maxlen:
+            self._spill(history[0])  # About to be evicted by the append
+        history.append(evolved)
+        self._latest_by_task[task_type] = evolved
         
         return evolved
     
@@ -463,19 +676,23 @@ Provide analysis and recommendations:
         if not outcomes:
             return patterns
         
-        total_tokens = sum(o.get('tokens_used', 0) for o in outcomes)
-        patterns['avg_tokens_used'] = total_tokens / len(outcomes)
-        
-        all_params = []
+        # One pass: sum tokens and narrow the first outcome's params down to
+        # those no other outcome (that sets the key) disagrees with
+        total_tokens = 0
+        common = dict(outcomes[0].get('params', {}))
         for o in outcomes:
-            params = o.get('params', {})
-            all_params.append(params)
+            total_tokens += o.get('tokens_used', 0)
+            if common:
+                params = o.get('params', {})
+                differing = [
+                    key for key, value in common.items()
+                    if key in params and params[key] != value
+                ]
+                for key in differing:
+                    del common[key]
         
-        if all_params:
-            for key in all_params[0].keys():
-                values = [p.get(key) for p in all_params if key in p]
-                if len(set(values)) == 1:
-                    patterns['common_params'][key] = values[0]
+        patterns['avg_tokens_used'] = total_tokens / len(outcomes)
+        patterns['common_params'] = common
         
         return patterns
     
@@ -485,77 +702,155 @@ Provide analysis and recommendations:
         success_patterns: Dict,
         failure_patterns: Dict
     ) -> str:
-        """Create prompt for LLM evolution"""
-        return f"""
-        Analyze these outcomes and propose strategy evolution:
-        
-        TASK TYPE: {task_type}
-        
-        SUCCESS PATTERNS ({success_patterns['outcome_count']} samples):
-        - Avg tokens: {success_patterns['avg_tokens_used']:.0f}
-        - Common params: {success_patterns['common_params']}
-        
-        FAILURE PATTERNS ({failure_patterns['outcome_count']} samples):
-        - Avg tokens: {failure_patterns['avg_tokens_used']:.0f}
-        - Common params: {failure_patterns['common_params']}
-        
-        CONSTITUTIONAL REQUIREMENTS:
-        - Must use fastest protocol available
-        - Must carry DNA with context
-        - Must refine en route
-        
-        Return JSON evolution proposal:
-        {{
-            "changes_summary": "brief description",
-            "parameter_adjustments": {{"param": new_value}},
-            "prompt_modifications": "new prompt text or modifications",
-            "expected_improvement": 0.0-1.0,
-            "confidence": 0.0-1.0,
-            "reasoning": "explanation"
-        }}
-        """
+        """Create the per-call part of the evolution prompt"""
+        return f"""TASK TYPE: {task_type}
+
+SUCCESS PATTERNS ({success_patterns['outcome_count']} samples):
+- Avg tokens: {success_patterns['avg_tokens_used']:.0f}
+- Common params: {success_patterns['common_params']}
+
+FAILURE PATTERNS ({failure_patterns['outcome_count']} samples):
+- Avg tokens: {failure_patterns['avg_tokens_used']:.0f}
+- Common params: {failure_patterns['common_params']}"""
     
-    async def _call_llm(self, prompt: str) -> str:
+    async def _call_llm(self, prompt: str, system: Optional[str] = None) -> str:
         """Call local LLM for evolution"""
         try:
-            import requests
-            response = requests.post(
-                f"{self.ollama_url}/api/generate",
-                json={
-                    'model': self.config.model,
-                    'prompt': prompt,
-                    'stream': False,
-                    'options': {'temperature': 0.3}
-                },
-                timeout=60
-            )
-            result = response.json()
-            return result.get('response', '')
+            return await self._request_llm(prompt, system)
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
             return '{}'
     
+    async def _request_llm(self, prompt: str, system: Optional[str] = None) -> str:
+        """POST one generate request to Ollama; transport errors propagate"""
+        url = f"{self.ollama_url}/api/generate"
+        body = {
+            'model': self.config.model,
+            'prompt': prompt,
+            'stream': False,
+            'options': {'temperature': 0.3}
+        }
+        if system is not None:
+            body['system'] = system
+        if self.config.keep_alive is not None:
+            body['keep_alive'] = self.config.keep_alive
+        if aiohttp is None:
+            # No aiohttp: keep the blocking client off the event loop
+            result = await asyncio.to_thread(self._post_blocking, url, body)
+        else:
+            if self._session is None or self._session.closed:
+                # One pooled session per DarwinLLM so calls reuse connections
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=self.config.max_connections,
+                        keepalive_timeout=300
+                    ),
+                    timeout=aiohttp.ClientTimeout(total=60)
+                )
+            async with self._session.post(url, json=body) as response:
+                result = await response.json(content_type=None)
+        return result.get('response', '')
+    
+    @staticmethod
+    def _post_blocking(url: str, body: Dict) -> Dict:
+        """Stdlib fallback for _request_llm, run in a worker thread"""
+        import urllib.request
+        request = urllib.request.Request(
+            url,
+            data=json.dumps(body).encode(),
+            headers={'Content-Type': 'application/json'}
+        )
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return _loads(response.read())
+    
+    async def aclose(self):
+        """Close the HTTP session and flush any pending history spill"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._spill_task is not None:
+            self._spill_queue.put_nowait(None)
+            await self._spill_task
+            self._spill_task = self._spill_queue = None
+    
+    def _spill(self, evolution: Dict):
+        """Queue an evicted evolution for the background spill writer"""
+        if self._spill_task is None:
+            self._spill_queue = asyncio.Queue()
+            self._spill_task = asyncio.create_task(self._spill_writer())
+        self._spill_queue.put_nowait(evolution)
+    
+    async def _spill_writer(self):
+        """Append queued evolutions to history_spill_path until told to stop"""
+        queue = self._spill_queue
+        while True:
+            entries = [await queue.get()]
+            while not queue.empty():
+                entries.append(queue.get_nowait())
+            lines = [json.dumps(entry, default=str) for entry in entries if entry is not None]
+            if lines:
+                try:
+                    await asyncio.to_thread(self._append_history_lines, lines)
+                except OSError as e:
+                    logger.error(f"Evolution history spill failed: {e}")
+            if None in entries:
+                return
+    
+    def _append_history_lines(self, lines: List[str]):
+        with open(self.config.history_spill_path, 'a', encoding='utf-8') as spill:
+            spill.write('\n'.join(lines) + '\n')
+    
     def _parse_evolution(self, response: str) -> Dict:
         """Parse LLM evolution response"""
-        import re
-        json_match = re.search(r'\{[^{}]*\}', response, re.DOTALL)
-        if json_match:
+        # Common case: the reply is nothing but the JSON object
+        text = response.strip()
+        if text.startswith('{') and text.endswith('}'):
             try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
+                evolution = _loads(text)
+                if isinstance(evolution, dict):
+                    return evolution
+            except ValueError:
                 pass
+        
+        # Otherwise try each '{' in turn; raw_decode handles nested objects in one pass
+        start = response.find('{')
+        while start != -1:
+            try:
+                evolution, _ = _JSON_DECODER.raw_decode(response, start)
+                return evolution
+            except json.JSONDecodeError:
+                start = response.find('{', start + 1)
         return {'raw_response': response}
     
+    def _parse_evolution_batch(self, response: str, count: int) -> Optional[List[Dict]]:
+        """Pull a list of `count` proposal dicts out of a batched reply, or None"""
+        start = response.find('[')
+        while start != -1:
+            try:
+                proposals, _ = _JSON_DECODER.raw_decode(response, start)
+            except json.JSONDecodeError:
+                start = response.find('[', start + 1)
+                continue
+            if (
+                isinstance(proposals, list)
+                and len(proposals) == count
+                and all(isinstance(proposal, dict) for proposal in proposals)
+            ):
+                return proposals
+            start = response.find('[', start + 1)
+        return None
+    
     def _review_constitution(self, evolution: Dict) -> ConstitutionalReview:
         """Review evolution for constitutional compliance"""
         issues = []
+        keys = _collect_keys(evolution)
         
         for required in CONSTITUTION_MUST_HAVES:
-            if required not in str(evolution):
+            if required not in keys:
                 issues.append(f"Missing required: {required}")
         
         for forbidden in CONSTITUTION_CANNOT_HAVES:
-            if forbidden in str(evolution):
+            if forbidden in keys:
                 issues.append(f"Violates constraint: {forbidden}")
         
         return ConstitutionalReview(
@@ -570,9 +865,10 @@ Provide analysis and recommendations:
     ) -> Dict:
         """Patch evolution to satisfy constitution"""
         patched = evolution.copy()
+        keys = _collect_keys(patched)
         
         for required in CONSTITUTION_MUST_HAVES:
-            if required not in str(patched):
+            if required not in keys:
                 patched[required] = True
         
         for forbidden in CONSTITUTION_CANNOT_HAVES:
@@ -586,10 +882,7 @@ Provide analysis and recommendations:
     
     def get_evolved_strategy(self, task_type: str) -> Optional[Dict]:
         """Get latest evolved strategy for task type"""
-        for evolution in reversed(self.evolution_history):
-            if evolution.get('task_type') == task_type:
-                return evolution
-        return None
+        return self._latest_by_task.get(task_type)
 
 
 # ============================================================================
@@ -603,6 +896,8 @@ class Darwin3Enforcer:
     
     def __init__(self, component: str):
         self.component = component
+        self._component_upper = component.upper()
+        self._secret = _secret_for(component)
         self.signature_history: List[Dict] = []
         self.mutation_log: List[DarwinMutation] = []
     
@@ -671,28 +966,32 @@ class Darwin3Enforcer:
     
     def _create_signature(self, mutation: DarwinMutation) -> str:
         """Create Darwin signature"""
-        lineage = mutation.parent_mutations + [mutation.timestamp]
-        lineage_str = "|".join(str(x) for x in lineage)
-        secret = os.getenv(f"DARWIN_SECRET_{self.component.upper()}", "default")
-        
-        proof = hashlib.blake2b(
-            f"{lineage_str}{secret}".encode(),
-            digest_size=16
-        ).hexdigest()
-        
-        return f"DARWIN-{self.component.upper()}-{proof}"
+        proof = _lineage_proof(mutation.parent_mutations, mutation.timestamp, self._secret)
+        return f"DARWIN-{self._component_upper}-{proof}"
 
 
 # ============================================================================
 # MAIN DARWIN ORCHESTRATOR
 # ============================================================================
 
+def _default_objective(solution: Dict) -> float:
+    """Flat fitness used when a mutation supplies no objective function"""
+    return 0.5
+
+
 class DarwinOrchestrator:
     """
     Main orchestrator for all Darwin processes.
     """
     
-    def __init__(self, component: str, ollama_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        component: str,
+        ollama_url: str = "http://localhost:11434",
+        max_concurrency: int = 4,
+        batch_window_ms: float = 10.0,
+        max_batch: int = 8
+    ):
         self.component = component
         self.darwin1 = Darwin1Algorithm()
         self.darwin2 = DarwinLLM(ollama_url=ollama_url)
@@ -700,16 +999,39 @@ class DarwinOrchestrator:
         self.active_mutations: List[DarwinMutation] = []
         self.evolution_tasks: asyncio.Queue = asyncio.Queue()
         self.running = False
+        # Caps mutations processed at once (match Ollama's OLLAMA_NUM_PARALLEL)
+        self.max_concurrency = max_concurrency
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._inflight: set = set()
+        self._processor_task: Optional[asyncio.Task] = None
+        # Mutations arriving within one (jittered) window are dispatched
+        # together; context refinements in a batch share one LLM call
+        self.batch_window_ms = batch_window_ms
+        self.max_batch = max_batch
+        self._jitter = random.Random()  # Own stream: keeps Darwin-1 seeds intact
+        # Evolution type -> handler; anything unlisted runs generic evolution
+        self._dispatch = {
+            DarwinEvolutionType.DNA_OPTIMIZATION: self._process_dna_evolution,
+            DarwinEvolutionType.CONTEXT_REFINEMENT: self._process_context_evolution,
+        }
     
     async def start(self):
         """Start Darwin evolution processes"""
         self.running = True
-        asyncio.create_task(self._evolution_processor())
+        self._sem = asyncio.Semaphore(self.max_concurrency)
+        self._processor_task = asyncio.create_task(self._evolution_processor())
         logger.info(f"Darwin orchestrator started for {self.component}")
     
     async def stop(self):
         """Stop Darwin evolution"""
         self.running = False
+        task, self._processor_task = self._processor_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        await self.darwin2.aclose()
         logger.info(f"Darwin orchestrator stopped for {self.component}")
     
     async def submit_mutation(
@@ -732,30 +1054,102 @@ class DarwinOrchestrator:
         """Process evolution tasks"""
         while self.running:
             try:
-                mutation = await asyncio.wait_for(
-                    self.evolution_tasks.get(),
-                    timeout=1.0
-                )
+                batch = await self._drain()
                 
-                if mutation.evolution_type == DarwinEvolutionType.DNA_OPTIMIZATION:
-                    result = await self._process_dna_evolution(mutation)
-                elif mutation.evolution_type == DarwinEvolutionType.CONTEXT_REFINEMENT:
-                    result = await self._process_context_evolution(mutation)
+                contexts, others = [], []
+                for mutation in batch:
+                    if mutation.evolution_type == DarwinEvolutionType.CONTEXT_REFINEMENT:
+                        contexts.append(mutation)
+                    else:
+                        others.append(mutation)
+                if len(contexts) > 1:
+                    self._spawn(self._handle_context_batch(contexts))
                 else:
-                    result = await self._process_generic_evolution(mutation)
+                    others.extend(contexts)
                 
-                self.darwin3.apply_mutation(mutation)
-                self.active_mutations.append(mutation)
+                # Hand off so the next batch is dequeued while these run
+                for mutation in others:
+                    self._spawn(self._handle(mutation))
                 
             except asyncio.TimeoutError:
                 continue
             except Exception as e:
                 logger.error(f"Evolution processor error: {e}")
     
+    async def _drain(self) -> List[DarwinMutation]:
+        """Wait for a mutation, then collect any more arriving within the batch window"""
+        queue = self.evolution_tasks
+        batch = [await asyncio.wait_for(queue.get(), timeout=1.0)]
+        
+        loop = asyncio.get_running_loop()
+        window = self.batch_window_ms / 1000 * (0.5 + self._jitter.random() / 2)
+        deadline = loop.time() + window
+        try:
+            while len(batch) < self.max_batch:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            # Stopped mid-window: hand the collected mutations back to the queue
+            for mutation in batch:
+                queue.put_nowait(mutation)
+            raise
+        return batch
+    
+    def _spawn(self, coro):
+        """Run coro as a tracked in-flight task"""
+        if not self.running:
+            coro.close()
+            logger.warning(f"Darwin orchestrator for {self.component} is stopped; dropping evolution task")
+            return
+        task = asyncio.create_task(coro)
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+    
+    async def _handle_context_batch(self, mutations: List[DarwinMutation]):
+        """Evolve several context refinements with one Darwin-2 call"""
+        try:
+            async with self._sem:
+                await self.darwin2.evolve_strategies([
+                    (
+                        mutation.payload.get('task_type', 'extraction'),
+                        mutation.payload.get('successes', []),
+                        mutation.payload.get('failures', [])
+                    )
+                    for mutation in mutations
+                ])
+            
+            for mutation in mutations:
+                self.darwin3.apply_mutation(mutation)
+                self.active_mutations.append(mutation)
+        
+        except Exception as e:
+            logger.error(f"Evolution processor error: {e}")
+    
+    async def _handle(self, mutation: DarwinMutation):
+        """Process one mutation under the concurrency limit"""
+        try:
+            handler = self._dispatch.get(mutation.evolution_type, self._process_generic_evolution)
+            async with self._sem:
+                result = await handler(mutation)
+            
+            self.darwin3.apply_mutation(mutation)
+            self.active_mutations.append(mutation)
+            
+        except Exception as e:
+            logger.error(f"Evolution processor error: {e}")
+    
     async def _process_dna_evolution(self, mutation: DarwinMutation) -> Dict:
         """Process DNA optimization evolution"""
         population = mutation.payload.get('population', [{}])
-        objective = mutation.payload.get('objective_function', lambda x: 0.5)
+        objective = mutation.payload.get('objective_function', _default_objective)
         return await self.darwin1.run_evolution(population, objective)
     
     async def _process_context_evolution(self, mutation: DarwinMutation) -> Dict:
@@ -768,7 +1162,7 @@ class DarwinOrchestrator:
     async def _process_generic_evolution(self, mutation: DarwinMutation) -> Dict:
         """Process generic evolution"""
         population = mutation.payload.get('population', [{}])
-        objective = mutation.payload.get('objective_function', lambda x: 0.5)
+        objective = mutation.payload.get('objective_function', _default_objective)
         return await self.darwin1.run_evolution(population, objective)
     
     def get_status(self) -> Dict:
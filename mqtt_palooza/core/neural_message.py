@@ -9,15 +9,70 @@ Provides binary-serializable messages with:
 - Constitutional compliance verification
 """
 
-import uuid
+import os
+import random
+import struct
 import time
 import json
 import hashlib
+import threading
+from collections import deque
 from enum import Enum, auto
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from typing import Deque, Dict, Any, Optional, List
 import msgpack
 
+try:
+    import msgspec  # Optional: faster msgpack codec, same wire format
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson  # Optional: C encoder for to_json
+
+    def _dumps_indented(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            # e.g. ints beyond 64 bits, which json encodes fine
+            return json.dumps(obj, indent=2)
+except ImportError:
+    def _dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# Payload field names that must never travel on the bus (matched lowercased)
+_RESTRICTED = frozenset({'password', 'secret', 'api_key'})
+
+# Message IDs only need to be unique, not unguessable: draw the same 32 bits
+# uuid4()[:8] gave from a seeded PRNG, reseeded in forked children so
+# worker processes don't repeat the parent's sequence
+_id_rng = random.Random()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_id_rng.seed)
+
+# First element of every to_binary() array; bump when field order changes
+SCHEMA_VERSION = 1
+
+# Encoders keep internal buffers, so each thread reuses its own
+_packer_local = threading.local()
+
+
+def _pack(obj: Any) -> bytes:
+    """msgpack-encode obj with this thread's reusable encoder."""
+    pack = getattr(_packer_local, 'pack', None)
+    if pack is None:
+        if msgspec is not None:
+            pack = msgspec.msgpack.Encoder().encode
+        else:
+            pack = msgpack.Packer(use_bin_type=True).pack
+        _packer_local.pack = pack
+    return pack(obj)
+
+
+# Stateless, so one decoder serves every thread
+_unpack = msgspec.msgpack.Decoder().decode if msgspec is not None else msgpack.unpackb
+
 
 class MessagePriority(Enum):
     """Priority levels for message routing (QoS)"""
@@ -116,7 +171,7 @@ class NeuralMessage:
     
     def __post_init__(self):
         if self.id is None:
-            self.id = str(uuid.uuid4())[:8]
+            self.id = '%08x' % _id_rng.getrandbits(32)
         if self.priority is None:
             self.priority = MessagePriority.NORMAL
         if self.focus is None:
@@ -129,76 +184,100 @@ class NeuralMessage:
             self.timestamp = time.time()
     
     def to_binary(self) -> bytes:
-        """Serialize to binary for efficient transmission."""
-        data = {
-            'id': self.id,
-            't': self.topic,
-            'p': self.priority.value,
-            'f': self.focus.to_dict(),
-            'pl': self.payload,
-            'c': {
-                'os': self.context.original_size,
-                'cs': self.context.current_size,
-                'rs': self.context.relevance_score,
-                'fe': self.context.filtered_elements,
-                'fm': self.context.focus_mode.value,
-                'h': self.context.hops,
-                'r': self.context.refinements
-            },
-            's': self.source,
-            'd': self.destination,
-            'ts': self.timestamp,
-            'ttl': self.ttl_seconds,
-            'ack': self.requires_ack,
-            'corr': self.correlation_id,
-            'cc': self.constitutional_compliance
-        }
-        return msgpack.packb(data)
+        """Serialize to binary for efficient transmission.
+        
+        Fields are packed positionally (a msgpack array) rather than as a
+        keyed map; from_binary reads them back in the same order.
+        """
+        focus = self.focus
+        context = self.context
+        data = (
+            SCHEMA_VERSION,
+            self.id,
+            self.topic,
+            self.priority.value,
+            (
+                focus.mode.value,
+                focus.target_entities,
+                focus.relevance_threshold,
+                focus.max_tokens,
+                focus.keywords,
+                focus.negative_keywords
+            ) if focus else None,
+            self.payload,
+            (
+                context.original_size,
+                context.current_size,
+                context.relevance_score,
+                context.filtered_elements,
+                context.focus_mode.value,
+                context.hops,
+                context.refinements
+            ),
+            self.source,
+            self.destination,
+            self.timestamp,
+            self.ttl_seconds,
+            self.requires_ack,
+            self.correlation_id,
+            self.constitutional_compliance
+        )
+        return _pack(data)
     
     @classmethod
     def from_binary(cls, data: bytes) -> 'NeuralMessage':
         """Deserialize from binary."""
-        raw = msgpack.unpackb(data)
+        raw = _unpack(data)
+        if not isinstance(raw, list) or not raw or raw[0] != SCHEMA_VERSION:
+            version = raw[0] if isinstance(raw, list) and raw else None
+            raise ValueError(f"Unsupported NeuralMessage schema version: {version!r}")
         
-        msg = cls(
-            id=raw['id'],
-            topic=raw['t'],
-            priority=MessagePriority(raw['p']),
-            payload=raw['pl'],
-            source=raw['s'],
-            destination=raw['d'],
-            timestamp=raw['ts'],
-            ttl_seconds=raw['ttl'],
-            requires_ack=raw['ack'],
-            correlation_id=raw.get('corr'),
-            constitutional_compliance=raw.get('cc', True)
-        )
+        (_, msg_id, topic, priority, focus, payload, context, source, destination,
+         timestamp, ttl_seconds, requires_ack, correlation_id, compliance) = raw
         
-        if raw.get('f'):
-            msg.focus = MessageFocus(
-                mode=FocusMode(raw['f']['mode']),
-                target_entities=raw['f']['target_entities'],
-                relevance_threshold=raw['f']['relevance_threshold'],
-                max_tokens=raw['f']['max_tokens'],
-                keywords=raw['f']['keywords'],
-                negative_keywords=raw['f']['negative_keywords']
+        # Build focus and context up front so __post_init__ doesn't create
+        # throwaway defaults that would immediately be replaced
+        if focus:
+            focus = MessageFocus(
+                mode=FocusMode(focus[0]),
+                target_entities=focus[1],
+                relevance_threshold=focus[2],
+                max_tokens=focus[3],
+                keywords=focus[4],
+                negative_keywords=focus[5]
             )
+        else:
+            focus = None
         
-        msg.context = EnRouteContext(
-            original_size=raw['c']['os'],
-            current_size=raw['c']['cs'],
-            relevance_score=raw['c']['rs'],
-            filtered_elements=raw['c']['fe'],
-            focus_mode=FocusMode(raw['c']['fm']),
-            hops=raw['c']['h'],
-            refinements=raw['c']['r']
+        context = EnRouteContext(
+            original_size=context[0],
+            current_size=context[1],
+            relevance_score=context[2],
+            filtered_elements=context[3],
+            focus_mode=FocusMode(context[4]),
+            hops=context[5],
+            refinements=context[6]
         )
         
-        return msg
+        return cls(
+            id=msg_id,
+            topic=topic,
+            priority=MessagePriority(priority),
+            focus=focus,
+            payload=payload,
+            context=context,
+            source=source,
+            destination=destination,
+            timestamp=timestamp,
+            ttl_seconds=ttl_seconds,
+            requires_ack=requires_ack,
+            correlation_id=correlation_id,
+            constitutional_compliance=compliance
+        )
     
     def to_json(self) -> str:
         """Serialize to JSON for debugging."""
-        return json.dumps(self.to_dict(), indent=2)
+        return _dumps_indented(self.to_dict())
     
     def to_dict(self) -> Dict:
         """Serialize to dictionary."""
@@ -233,8 +312,14 @@ class NeuralMessage:
     
     def create_signature(self) -> str:
         """Create message signature for integrity."""
-        data = f"{self.id}:{self.topic}:{self.timestamp}"
-        return hashlib.blake2b(data.encode(), digest_size=8).hexdigest()
+        # Fed piecewise; the timestamp goes in as its raw double, not str()
+        signature = hashlib.blake2b(digest_size=8)
+        signature.update(self.id.encode())
+        signature.update(b':')
+        signature.update(self.topic.encode())
+        signature.update(b':')
+        signature.update(struct.pack('<d', self.timestamp))
+        return signature.hexdigest()
 
 
 class MessageBus:
@@ -244,38 +329,68 @@ class MessageBus:
         self.broker_host = broker_host
         self.broker_port = broker_port
         self.subscribers: Dict[str, List[callable]] = {}
-        self.message_history: List[NeuralMessage] = []
+        # Frozen per-topic handler tuples for publish; subscribe() and
+        # unsubscribe() invalidate, so change subscribers through them
+        self._handlers_cache: Dict[str, tuple] = {}
         self.max_history = 1000
+        # Ring buffer: appends past max_history drop the oldest in O(1)
+        self.message_history: Deque[NeuralMessage] = deque(maxlen=self.max_history)
         
     def subscribe(self, topic: str, handler: callable):
         """Subscribe to a topic."""
         if topic not in self.subscribers:
             self.subscribers[topic] = []
         self.subscribers[topic].append(handler)
+        self._handlers_cache.pop(topic, None)
+    
+    def unsubscribe(self, topic: str, handler: callable) -> bool:
+        """Unsubscribe a handler from a topic. Returns False if it wasn't subscribed."""
+        handlers = self.subscribers.get(topic)
+        if not handlers or handler not in handlers:
+            return False
+        handlers.remove(handler)
+        if not handlers:
+            del self.subscribers[topic]
+        self._handlers_cache.pop(topic, None)
+        return True
     
     def publish(self, message: NeuralMessage) -> bool:
         """Publish a message to the bus."""
         if not self._check_compliance(message):
             return False
         
-        for handler in self.subscribers.get(message.topic, []):
+        topic = message.topic
+        handlers = self._handlers_cache.get(topic)
+        if handlers is None:
+            handlers = tuple(self.subscribers.get(topic, ()))
+            if handlers:  # Don't grow the cache for topics nobody listens on
+                self._handlers_cache[topic] = handlers
+        
+        for handler in handlers:
+            # Per-handler guard so one failure doesn't starve later handlers
             try:
                 handler(message)
             except Exception as e:
                 print(f"Handler error: {e}")
         
         self.message_history.append(message)
-        if len(self.message_history) > self.max_history:
-            self.message_history.pop(0)
         
         return True
     
     def _check_compliance(self, message: NeuralMessage) -> bool:
         """Check constitutional compliance."""
-        restricted = ['password', 'secret', 'api_key']
-        for field in str(message.payload).lower():
-            if field in restricted:
-                return False
+        # Walk nested dicts/lists and reject on any restricted field name
+        stack = [message.payload]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                for key, value in item.items():
+                    if isinstance(key, str) and key.lower() in _RESTRICTED:
+                        return False
+                    if isinstance(value, (dict, list, tuple)):
+                        stack.append(value)
+            elif isinstance(item, (list, tuple)):
+                stack.extend(item)
         return True
 
 
@@ -0,0 +1,70 @@
+"""
+Tests for Darwin-2 evolution history bounds and spilling.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from mqtt_palooza.core.darwin import DarwinLLM, DarwinLLMConfig
+
+
+def _proposal(n: int) -> dict:
+    return {'changes_summary': f'change {n}', 'parameter_adjustments': {}}
+
+
+class TestDarwinHistory(unittest.IsolatedAsyncioTestCase):
+    def test_history_cap_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            DarwinLLMConfig(history_cap=0)
+
+    async def test_evicted_evolutions_are_spilled(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'history.jsonl')
+            darwin = DarwinLLM(DarwinLLMConfig(history_cap=2, history_spill_path=path))
+
+            for n in range(3):
+                darwin._record_evolution(_proposal(n), 'scrape', 10)
+            await darwin.aclose()
+
+            with open(path) as f:
+                spilled = [json.loads(line) for line in f]
+            self.assertEqual([e['changes_summary'] for e in spilled], ['change 0'])
+            self.assertEqual(
+                [e['changes_summary'] for e in darwin.evolution_history],
+                ['change 1', 'change 2']
+            )
+
+    async def test_aclose_flushes_pending_spill(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'history.jsonl')
+            darwin = DarwinLLM(DarwinLLMConfig(history_cap=1, history_spill_path=path))
+
+            for n in range(5):
+                darwin._record_evolution(_proposal(n), 'scrape', 10)
+            # Nothing has yielded to the spill writer yet
+            self.assertFalse(os.path.exists(path))
+            await darwin.aclose()
+
+            with open(path) as f:
+                spilled = [json.loads(line)['changes_summary'] for line in f]
+            self.assertEqual(spilled, ['change 0', 'change 1', 'change 2', 'change 3'])
+
+    async def test_evicted_task_keeps_latest_strategy(self):
+        darwin = DarwinLLM(DarwinLLMConfig(history_cap=1))
+
+        darwin._record_evolution(_proposal(0), 'scrape', 10)
+        darwin._record_evolution(_proposal(1), 'llm', 10)
+
+        self.assertEqual([e['task_type'] for e in darwin.evolution_history], ['llm'])
+        self.assertEqual(darwin.get_evolved_strategy('scrape')['changes_summary'], 'change 0')
+        self.assertIsNone(darwin.get_evolved_strategy('dna'))
+        await darwin.aclose()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests for the NeuralMessage binary wire format and MessageBus compliance checks.
+"""
+
+import os
+import sys
+import unittest
+
+import msgpack
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from mqtt_palooza.core.neural_message import (
+    SCHEMA_VERSION, FocusMode, MessageBus, MessageFocus, MessagePriority, NeuralMessage,
+    create_scrape_request
+)
+
+
+def _message() -> NeuralMessage:
+    msg = create_scrape_request('https://example.com', {'title': 'h1'}, FocusMode.RELEVANCE)
+    msg.priority = MessagePriority.HIGH
+    msg.focus.keywords = ['price', 'Product']
+    msg.focus.negative_keywords = ['ads']
+    msg.payload.update({'blob': b'\x00\x01', 'big': 2 ** 40, 'nested': {'a': [1, {'b': None}]}})
+    msg.context.original_size = 120
+    msg.context.current_size = 80
+    msg.context.relevance_score = 0.75
+    msg.context.filtered_elements = ['script']
+    msg.context.hops = 2
+    msg.context.refinements = [{'type': 'relevance_filter', 'before': 120, 'after': 80}]
+    msg.correlation_id = 'req-1'
+    return msg
+
+
+class TestBinaryFormat(unittest.TestCase):
+    def assertSameOnWire(self, restored: NeuralMessage, msg: NeuralMessage):
+        # The context's compression_ratio and timestamp are not carried on the wire
+        for name in ('id', 'topic', 'priority', 'focus', 'payload', 'source', 'destination',
+                     'timestamp', 'ttl_seconds', 'requires_ack', 'correlation_id',
+                     'constitutional_compliance'):
+            self.assertEqual(getattr(restored, name), getattr(msg, name), name)
+        for name in ('original_size', 'current_size', 'relevance_score', 'filtered_elements',
+                     'focus_mode', 'hops', 'refinements'):
+            self.assertEqual(getattr(restored.context, name), getattr(msg.context, name), name)
+
+    def test_round_trip(self):
+        msg = _message()
+        self.assertSameOnWire(NeuralMessage.from_binary(msg.to_binary()), msg)
+
+    def test_round_trip_without_focus(self):
+        msg = _message()
+        msg.focus = None
+
+        restored = NeuralMessage.from_binary(msg.to_binary())
+
+        self.assertEqual(restored.focus, MessageFocus())
+        self.assertEqual(restored.payload, msg.payload)
+
+    def test_rejects_map_format(self):
+        legacy = msgpack.packb({'id': 'abcd1234', 't': 'scrape/request', 'p': 1, 'pl': {}})
+        with self.assertRaises(ValueError):
+            NeuralMessage.from_binary(legacy)
+
+    def test_rejects_unknown_schema_version(self):
+        raw = msgpack.unpackb(_message().to_binary(), strict_map_key=False)
+        raw[0] = SCHEMA_VERSION + 1
+        with self.assertRaises(ValueError):
+            NeuralMessage.from_binary(msgpack.packb(raw))
+
+
+class TestCompliance(unittest.TestCase):
+    def setUp(self):
+        self.bus = MessageBus()
+        self.delivered = []
+        self.bus.subscribe('scrape/request', self.delivered.append)
+
+    def _publish(self, payload) -> bool:
+        msg = create_scrape_request('https://example.com', {'title': 'h1'})
+        msg.payload = payload
+        return self.bus.publish(msg)
+
+    def test_rejects_nested_restricted_key(self):
+        self.assertFalse(self._publish({'nested': {'Password': 1}}))
+        self.assertEqual(self.delivered, [])
+
+    def test_rejects_restricted_key_inside_list(self):
+        self.assertFalse(self._publish({'items': [{'ok': 1}, {'API_KEY': 'x'}]}))
+
+    def test_allows_restricted_word_as_value(self):
+        self.assertTrue(self._publish({'field': 'password', 'tags': ['secret']}))
+        self.assertEqual(len(self.delivered), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()